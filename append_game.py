@@ -1,17 +1,48 @@
 # append_game.py
-import json, uuid
+import uuid
+import msgspec
 from datetime import date
 from pathlib import Path
-from data import load_games, save_games
+from data import load_screenshot_index, append_game_record, compact_games
 
 REQUIRED_FIELDS = ["id","date","screenshot","opponent","score","quarters","players"]
 
+# Schema of one games.json record. Scores and quarters take int | float like validate_game does;
+# players stay plain dicts, which is what every data.get_* helper indexes.
+class Score(msgspec.Struct):
+    us: int | float
+    them: int | float
+
+class Quarters(msgspec.Struct):
+    us: list[int | float]
+    them: list[int | float]
+
+class GameRecord(msgspec.Struct, forbid_unknown_fields=True):
+    """Known keys only, so a new key fails loudly instead of being dropped on re-encode."""
+    id: str
+    date: str
+    screenshot: str
+    opponent: str
+    score: Score
+    quarters: Quarters
+    players: list[dict]
+    # Optional keys left UNSET are omitted again by to_builtins
+    opponent_players: list[dict] | msgspec.UnsetType = msgspec.UNSET
+    result: str | None | msgspec.UnsetType = msgspec.UNSET
+    ocr_meta: dict | None | msgspec.UnsetType = msgspec.field(default=msgspec.UNSET, name="_ocr_meta")
+
+_GAME_DECODER = msgspec.json.Decoder(GameRecord)
+
 def validate_game(game: dict) -> bool:
     for field in REQUIRED_FIELDS:
         if field not in game:
             raise ValueError(f"Missing required field: {field}")
     return True
 
+def decode_game(raw: bytes) -> GameRecord:
+    """Decode and schema-check one record straight from JSON bytes (ValidationError is a ValueError)."""
+    return _GAME_DECODER.decode(raw)
+
 def build_game_record(
     opponent: str,
     us_score: int,
@@ -32,18 +63,20 @@ def build_game_record(
         "players": players
     }
 
-def append_game(record: dict) -> None:
-    validate_game(record)
-    data = load_games()
-    existing = [g["screenshot"] for g in data["games"]]
-    if record["screenshot"] in existing:
-        print(f"[SKIP] {record['screenshot']} already imported.")
+def append_game(record: dict | GameRecord) -> None:
+    if not isinstance(record, GameRecord):
+        validate_game(record)
+        record = msgspec.convert(record, GameRecord)
+    if record.screenshot in load_screenshot_index():
+        print(f"[SKIP] {record.screenshot} already imported.")
         return
-    data["games"].append(record)
-    save_games(data)
-    print(f"[OK] Added game vs {record['opponent']} — {record['score']['us']}-{record['score']['them']}")
+    append_game_record(msgspec.to_builtins(record))
+    print(f"[OK] Added game vs {record.opponent} — {record.score.us}-{record.score.them}")
 
 if __name__ == "__main__":
     import sys
-    record = json.loads(sys.stdin.read())
-    append_game(record)
+    if "--compact" in sys.argv[1:]:
+        print(f"[OK] Compacted {compact_games()} record(s) into games.json")
+        sys.exit(0)
+    # Raw bytes go straight into the schema: one typed decode, no intermediate dict
+    append_game(decode_game(sys.stdin.buffer.read()))
@@ -1,9 +1,24 @@
 # data.py
 import json
+import numpy as np
 import pandas as pd
 from pathlib import Path
 
+try:
+    import orjson  # optional: ~3-10x faster JSON decode/encode
+except ImportError:
+    orjson = None
+
+try:
+    import simdjson  # optional: used when orjson is unavailable
+    _SIMDJSON_PARSER = simdjson.Parser()  # one parser, its buffers reused by every load
+except ImportError:
+    _SIMDJSON_PARSER = None
+
 GAMES_FILE = Path(__file__).parent / "games.json"
+GAMES_LOG  = Path(__file__).parent / "games.jsonl"  # append-only sidecar, folded in by compact_games()
+SCREENSHOT_INDEX = Path(__file__).parent / "screenshots.idx"  # version header, then one imported screenshot per line
+WRITE_BUFFER = 1 << 17      # 128 KiB: json.dump's many small writes flush far less often than at 8 KiB
 
 # Canonical player names — maps OCR variants to correct spelling
 NAME_ALIASES = {
@@ -19,48 +34,177 @@ NAME_ALIASES = {
 def normalize_name(name: str) -> str:
     return NAME_ALIASES.get(name, name)
 
-def load_games() -> dict:
+def _read_games_file() -> dict:
     if not GAMES_FILE.exists():
         return {"games": []}
+    if orjson is not None:
+        return orjson.loads(GAMES_FILE.read_bytes())
+    if _SIMDJSON_PARSER is not None:
+        return _SIMDJSON_PARSER.parse(GAMES_FILE.read_bytes()).as_dict()
     with open(GAMES_FILE, "r") as f:
         return json.load(f)
 
+def _read_games_log() -> list:
+    """Records appended to games.jsonl since the last compaction, one per line."""
+    if not GAMES_LOG.exists():
+        return []
+    loads = orjson.loads if orjson is not None else json.loads
+    with open(GAMES_LOG, "rb") as f:
+        return [loads(line) for line in f if line.strip()]
+
+def load_games() -> dict:
+    data = _read_games_file()
+    pending_log = _read_games_log()
+    if pending_log:
+        data["games"].extend(pending_log)
+    return data
+
+def games_version() -> tuple:
+    """(games.json mtime, games.jsonl mtime) — changes whenever either file is written."""
+    return tuple(f.stat().st_mtime if f.exists() else 0.0 for f in (GAMES_FILE, GAMES_LOG))
+
 def save_games(data: dict) -> None:
-    with open(GAMES_FILE, "w") as f:
-        json.dump(data, f, indent=2)
+    # data is the full merged set from load_games(), so the sidecar is now redundant
+    if orjson is not None:
+        GAMES_FILE.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+    else:
+        with open(GAMES_FILE, "w", buffering=WRITE_BUFFER) as f:
+            json.dump(data, f, indent=2)
+    GAMES_LOG.unlink(missing_ok=True)
+    _write_screenshot_index(data["games"])
+
+def append_game_record(record: dict) -> None:
+    """O(1) append to games.jsonl instead of rewriting the whole games.json."""
+    if orjson is not None:
+        line = orjson.dumps(record, option=orjson.OPT_NON_STR_KEYS) + b"\n"
+    else:
+        line = (json.dumps(record) + "\n").encode("utf-8")
+    index_current = _screenshot_index_current()  # checked before the append moves games.jsonl's mtime
+    with open(GAMES_LOG, "ab") as f:
+        f.write(line)
+    if index_current:
+        # Add the name, then re-stamp the fixed-width header in place for the new games.jsonl mtime
+        with open(SCREENSHOT_INDEX, "r+", encoding="utf-8") as f:
+            f.seek(0, 2)
+            f.write(record["screenshot"] + "\n")
+            f.seek(0)
+            f.write(_screenshot_index_stamp())
+
+def _screenshot_index_stamp() -> str:
+    """Fixed-width header of screenshots.idx: mtime (ns) and size of games.json and games.jsonl."""
+    stats = [f.stat() if f.exists() else None for f in (GAMES_FILE, GAMES_LOG)]
+    return "".join(f"{st.st_mtime_ns if st else 0:020d}{st.st_size if st else 0:016d}" for st in stats) + "\n"
+
+def _screenshot_index_current() -> bool:
+    """False when the index is missing or either games file changed behind it (git pull, hand edit)."""
+    if not SCREENSHOT_INDEX.exists():
+        return False
+    with open(SCREENSHOT_INDEX, encoding="utf-8") as f:
+        return f.readline() == _screenshot_index_stamp()
+
+def _write_screenshot_index(games: list) -> None:
+    SCREENSHOT_INDEX.write_text(_screenshot_index_stamp() + "".join(g["screenshot"] + "\n" for g in games),
+                                encoding="utf-8")
+
+def load_screenshot_index() -> set:
+    """Screenshots already imported, for O(1) dedup without loading every game."""
+    if not _screenshot_index_current():
+        games = load_games()["games"]
+        _write_screenshot_index(games)
+        return {g["screenshot"] for g in games}
+    return set(SCREENSHOT_INDEX.read_text(encoding="utf-8").splitlines()[1:])
+
+def compact_games() -> int:
+    """Fold games.jsonl into games.json. Returns the number of records folded in."""
+    folded = len(_read_games_log())
+    if folded:
+        save_games(load_games())
+    return folded
+
+STAT_COLS = ["pts","reb","ast","stl","blk","fls","to","fgm","fga","tpm","tpa","ftm","fta"]
+
+def games_to_players_table(games: list) -> pd.DataFrame:
+    """Flatten games into one row per player-game (names normalized)."""
+    empty = pd.DataFrame(columns=["name","pos",*STAT_COLS,"game_id","date","opponent","us_pts","them_pts",
+                                  "ocr_name","fg_disp","tp_disp","ft_disp","fg_pct_disp"])
+    if not games:
+        return empty
+    df = pd.json_normalize(games, record_path="players",
+                           meta=["id", "date", "opponent", ["score", "us"], ["score", "them"]],
+                           errors="ignore")
+    if df.empty:  # games, but none with players: json_normalize has no "name" column to work with
+        return empty
+    df = df.rename(columns={"id": "game_id", "score.us": "us_pts", "score.them": "them_pts"})
+    df["ocr_name"] = df["name"]
+    df["name"] = df["name"].map(normalize_name)
+    df["pos"]  = df["pos"].fillna("") if "pos" in df else ""
+    for stat in STAT_COLS:
+        df[stat] = df[stat].fillna(0) if stat in df else 0
+    # Arrow-backed columns: contiguous buffers, Arrow compute kernels for groupby sums
+    df = df.astype({stat: "int32[pyarrow]" for stat in STAT_COLS})
+    # Display strings computed once per column instead of per row at render time
+    df["fg_disp"] = df["fgm"].astype(str) + "/" + df["fga"].astype(str)
+    df["tp_disp"] = df["tpm"].astype(str) + "/" + df["tpa"].astype(str)
+    df["ft_disp"] = df["ftm"].astype(str) + "/" + df["fta"].astype(str)
+    df["fg_pct_disp"] = pct_display(df["fgm"], df["fga"])
+    return df
+
+def pct_display(made: pd.Series, att: pd.Series) -> pd.Series:
+    """Vectorized '58%' strings (0 decimals), 'N/A' where there were no attempts."""
+    has_att = att > 0
+    pct = (made / att.where(has_att) * 100).round().astype("Int64")
+    return (pct.astype(str) + "%").where(has_att, "N/A")
+
+def games_to_scores_table(games: list) -> pd.DataFrame:
+    """One row per game: id, date, opponent and final score (us/them)."""
+    return pd.DataFrame({
+        "game_id":  [g.get("id", "") for g in games],
+        "date":     [g.get("date", "") for g in games],
+        "opponent": [g.get("opponent", "") for g in games],
+        "us":       [g["score"]["us"] for g in games],
+        "them":     [g["score"]["them"] for g in games],
+    })
+
+def lttb_indices(values, n_out: int) -> np.ndarray:
+    """Positions kept by Largest-Triangle-Three-Buckets downsampling of an evenly spaced series.
+
+    Always keeps the first and last point; returns every position when
+    n_out >= len(values) or n_out < 3.
+    """
+    y = np.asarray(values, dtype=np.float64)
+    n = len(y)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+    edges = (np.arange(n_out - 1) * ((n - 2) / (n_out - 2))).astype(np.int64) + 1
+    edges[-1] = n - 1
+    keep = np.empty(n_out, dtype=np.int64)
+    keep[0], keep[-1] = 0, n - 1
+    a = 0
+    for i in range(n_out - 2):
+        lo, hi = edges[i], edges[i + 1]
+        nxt_hi = edges[i + 2] if i + 2 < len(edges) else n
+        nxt_x = (hi + nxt_hi - 1) / 2
+        nxt_y = y[hi:nxt_hi].mean()
+        xs = np.arange(lo, hi)
+        area = np.abs((a - nxt_x) * (y[lo:hi] - y[a]) - (a - xs) * (nxt_y - y[a]))
+        a = lo + int(np.argmax(area))
+        keep[i + 1] = a
+    return keep
 
 def get_player_totals(games: list) -> pd.DataFrame:
-    rows = {}
-    pos_counts = {}  # name -> {pos: count} for picking primary position
-    for game in games:
-        for p in game["players"]:
-            name = normalize_name(p["name"])
-            pos  = p.get("pos", "")
-            if name not in rows:
-                rows[name] = {
-                    "name": name, "pos": pos, "games": 0,
-                    "pts": 0, "reb": 0, "ast": 0, "stl": 0,
-                    "blk": 0, "fls": 0, "to": 0,
-                    "fgm": 0, "fga": 0, "tpm": 0, "tpa": 0,
-                    "ftm": 0, "fta": 0
-                }
-                pos_counts[name] = {}
-            r = rows[name]
-            r["games"] += 1
-            for stat in ["pts","reb","ast","stl","blk","fls","to","fgm","fga","tpm","tpa","ftm","fta"]:
-                r[stat] += p.get(stat, 0)
-            pos_counts[name][pos] = pos_counts[name].get(pos, 0) + 1
-    # Set primary position (most games at that pos)
-    for name, r in rows.items():
-        r["pos"] = max(pos_counts[name], key=pos_counts[name].get)
-    return pd.DataFrame(list(rows.values()))
+    players = games_to_players_table(games)
+    by_name = players.groupby("name", sort=False)
+    totals  = by_name[STAT_COLS].sum().astype("int64")  # back to NumPy for callers
+    totals.insert(0, "games", by_name.size())
+    # Primary position = most games at that pos (ties go to the first one seen)
+    pos_counts = players.groupby(["name", "pos"], sort=False).size()
+    primary    = pos_counts.groupby(level="name", sort=False).idxmax()
+    totals.insert(0, "pos", [pos for _, pos in primary])
+    return totals.reset_index()
 
 def get_player_averages(games: list) -> pd.DataFrame:
-    totals = get_player_totals(games)
-    avgs = totals.copy()
-    stat_cols = ["pts","reb","ast","stl","blk","fls","to","fgm","fga","tpm","tpa","ftm","fta"]
-    for col in stat_cols:
-        avgs[col] = (avgs[col] / avgs["games"]).round(1)
+    avgs = get_player_totals(games)
+    avgs[STAT_COLS] = avgs[STAT_COLS].div(avgs["games"], axis=0).round(1)
     return avgs
 
 def get_derived_stats(df: pd.DataFrame) -> pd.DataFrame:
@@ -441,6 +585,39 @@ def get_scoring_shares(games: list) -> pd.DataFrame:
     ])
 
 
+def _player_groups(games: list):
+    """Players table, first-seen name codes, the names, and each row's game index."""
+    players = games_to_players_table(games)
+    codes, names = pd.factorize(players["name"], sort=False)
+    game_idx = np.repeat(np.arange(len(games)), [len(g["players"]) for g in games])
+    return players, codes, names, game_idx
+
+def _group_sum(codes: np.ndarray, values: np.ndarray, n: int) -> np.ndarray:
+    """Per-code sums in one bincount pass (no sort, no Python loop)."""
+    return np.bincount(codes, weights=values, minlength=n)
+
+def _round1(values: np.ndarray) -> np.ndarray:
+    """round(v, 1) per group: Python's correctly-rounded halves, matching the old per-player loops."""
+    return np.array([round(v, 1) for v in values.tolist()], dtype=np.float64)
+
+def _primary_pos(players: pd.DataFrame, codes: np.ndarray, n: int) -> np.ndarray:
+    """Most common non-blank position per name code, "" if none (ties go to the first seen)."""
+    out = np.full(n, "", dtype=object)
+    pos = players["pos"].astype(str).str.strip().to_numpy()
+    has = pos != ""
+    if has.any():
+        counts = pd.Series(1, index=[codes[has], pos[has]]).groupby(level=[0, 1], sort=False).size()
+        for code, p in counts.groupby(level=0, sort=False).idxmax():
+            out[code] = p
+    return out
+
+def _game_score(players: pd.DataFrame) -> np.ndarray:
+    """Hollinger Game Score per player-game row (same formula as _calc_gs)."""
+    s = {c: players[c].to_numpy(dtype=np.float64) for c in STAT_COLS}
+    return (s["pts"] + 0.4*s["fgm"] - 0.7*s["fga"] - 0.4*(s["fta"] - s["ftm"])
+            + 0.7*s["reb"] + 0.3*s["ast"] + s["stl"] + 0.7*s["blk"] - 0.4*s["fls"] - s["to"])
+
+
 def get_positional_matchups(games: list) -> pd.DataFrame:
     """USA vs opponent stat comparison by position index across all games."""
     POS_LABELS = ["PG", "SG", "SF", "PF", "C"]
@@ -530,79 +707,33 @@ def get_positional_matchups(games: list) -> pd.DataFrame:
 
 def get_close_game_stats(games: list) -> pd.DataFrame:
     """Per-player performance in close games (margin <= 10) vs non-close games."""
-    buckets: dict = {}
-
-    for game in games:
-        margin   = abs(game["score"]["us"] - game["score"]["them"])
-        is_close = margin <= 10
-
-        for p in game["players"]:
-            name = normalize_name(p["name"])
-            pos  = p.get("pos", "").strip()
-            key  = name
-            if key not in buckets:
-                buckets[key] = {
-                    "name": name, "pos_list": [],
-                    "close_gs":  [], "close_pts":  [],
-                    "other_gs":  [], "other_pts":  [],
-                }
-            if pos:
-                buckets[key]["pos_list"].append(pos)
-
-            pts = p.get("pts", 0)
-            fgm = p.get("fgm", 0)
-            fga = p.get("fga", 0)
-            ftm = p.get("ftm", 0)
-            fta = p.get("fta", 0)
-            reb = p.get("reb", 0)
-            ast = p.get("ast", 0)
-            stl = p.get("stl", 0)
-            blk = p.get("blk", 0)
-            fls = p.get("fls", 0)
-            to  = p.get("to",  0)
-
-            gs = (pts
-                  + 0.4 * fgm
-                  - 0.7 * fga
-                  - 0.4 * (fta - ftm)
-                  + 0.7 * reb
-                  + 0.3 * ast
-                  + stl
-                  + 0.7 * blk
-                  - 0.4 * fls
-                  - to)
-
-            b = buckets[key]
-            if is_close:
-                b["close_gs"].append(gs)
-                b["close_pts"].append(pts)
-            else:
-                b["other_gs"].append(gs)
-                b["other_pts"].append(pts)
-
-    def _avg(lst):
-        return round(sum(lst) / len(lst), 1) if lst else None
-
-    rows = []
-    for name, b in buckets.items():
-        pl = b["pos_list"]
-        pos = max(set(pl), key=pl.count) if pl else ""
-        rows.append({
-            "name":        name,
-            "pos":         pos,
-            "close_games": len(b["close_gs"]),
-            "close_gs":    _avg(b["close_gs"]),
-            "close_pts":   _avg(b["close_pts"]),
-            "other_games": len(b["other_gs"]),
-            "other_gs":    _avg(b["other_gs"]),
-            "other_pts":   _avg(b["other_pts"]),
-        })
-
-    return pd.DataFrame(rows, columns=[
-        "name", "pos",
-        "close_games", "close_gs", "close_pts",
-        "other_games", "other_gs", "other_pts",
-    ])
+    players, codes, names, game_idx = _player_groups(games)
+    n = len(names)
+    margins  = np.array([abs(g["score"]["us"] - g["score"]["them"]) for g in games])
+    is_close = (margins <= 10)[game_idx] if len(games) else np.zeros(0, dtype=bool)
+    gs  = _game_score(players)
+    pts = players["pts"].to_numpy(dtype=np.float64)
+
+    def _split(mask):
+        c = codes[mask]
+        cnt = np.bincount(c, minlength=n)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            avg_gs  = _round1(_group_sum(c, gs[mask], n) / cnt)
+            avg_pts = _round1(_group_sum(c, pts[mask], n) / cnt)
+        return cnt, avg_gs, avg_pts
+
+    close_n, close_gs, close_pts = _split(is_close)
+    other_n, other_gs, other_pts = _split(~is_close)
+    return pd.DataFrame({
+        "name":        np.asarray(names, dtype=object),
+        "pos":         _primary_pos(players, codes, n),
+        "close_games": close_n,
+        "close_gs":    close_gs,
+        "close_pts":   close_pts,
+        "other_games": other_n,
+        "other_gs":    other_gs,
+        "other_pts":   other_pts,
+    })
 
 
 def get_usage_and_pie(games: list) -> pd.DataFrame:
@@ -613,64 +744,32 @@ def get_usage_and_pie(games: list) -> pd.DataFrame:
             / (team_PTS + team_REB + team_AST + team_STL + team_BLK
                - team_FGmiss - team_FTmiss - team_TO)
     """
-    player_acc: dict = {}
-    for game in games:
-        players = game["players"]
-        # Team totals for this game
-        t_pts  = sum(p.get("pts",0)  for p in players)
-        t_reb  = sum(p.get("reb",0)  for p in players)
-        t_ast  = sum(p.get("ast",0)  for p in players)
-        t_stl  = sum(p.get("stl",0)  for p in players)
-        t_blk  = sum(p.get("blk",0)  for p in players)
-        t_fga  = sum(p.get("fga",0)  for p in players)
-        t_fgm  = sum(p.get("fgm",0)  for p in players)
-        t_fta  = sum(p.get("fta",0)  for p in players)
-        t_ftm  = sum(p.get("ftm",0)  for p in players)
-        t_to   = sum(p.get("to",0)   for p in players)
-        t_fgmiss = t_fga - t_fgm
-        t_ftmiss = t_fta - t_ftm
-        t_poss = t_fga + 0.44 * t_fta + t_to  # team possessions proxy
-        t_pie_denom = (t_pts + t_reb + t_ast + t_stl + t_blk
-                       - t_fgmiss - t_ftmiss - t_to)
-
-        for p in players:
-            name = normalize_name(p["name"])
-            pos  = p.get("pos", "").strip()
-            key  = name
-            if key not in player_acc:
-                player_acc[key] = {"name": name, "pos_list": [], "games": 0,
-                                   "usg_list": [], "pie_list": []}
-            if pos:
-                player_acc[key]["pos_list"].append(pos)
-
-            pts  = p.get("pts", 0); fgm = p.get("fgm", 0); fga = p.get("fga", 0)
-            ftm  = p.get("ftm", 0); fta = p.get("fta", 0)
-            reb  = p.get("reb", 0); ast = p.get("ast", 0)
-            stl  = p.get("stl", 0); blk = p.get("blk", 0); to  = p.get("to", 0)
-            fgmiss = fga - fgm; ftmiss = fta - ftm
-            p_poss = fga + 0.44 * fta + to
-
-            usg = (p_poss / t_poss * 100) if t_poss > 0 else None
-            pie_num = pts + reb + ast + stl + blk - fgmiss - ftmiss - to
-            pie = (pie_num / t_pie_denom * 100) if t_pie_denom != 0 else None
-
-            d = player_acc[key]
-            d["games"] += 1
-            if usg is not None: d["usg_list"].append(usg)
-            if pie is not None: d["pie_list"].append(pie)
-
-    rows = []
-    for name, d in player_acc.items():
-        pl = d["pos_list"]
-        pos = max(set(pl), key=pl.count) if pl else ""
-        rows.append({
-            "name":    name,
-            "pos":     pos,
-            "games":   d["games"],
-            "usg_pct": round(sum(d["usg_list"]) / len(d["usg_list"]), 1) if d["usg_list"] else None,
-            "pie":     round(sum(d["pie_list"])  / len(d["pie_list"]),  1) if d["pie_list"]  else None,
-        })
-    df = pd.DataFrame(rows)
+    players, codes, names, game_idx = _player_groups(games)
+    n = len(names)
+    s = {c: players[c].to_numpy(dtype=np.float64) for c in STAT_COLS}
+    p_poss  = s["fga"] + 0.44 * s["fta"] + s["to"]
+    pie_num = (s["pts"] + s["reb"] + s["ast"] + s["stl"] + s["blk"]
+               - (s["fga"] - s["fgm"]) - (s["fta"] - s["ftm"]) - s["to"])
+    # Team totals per game, broadcast back to each player-game row
+    t_poss      = np.bincount(game_idx, weights=p_poss,  minlength=len(games))[game_idx]
+    t_pie_denom = np.bincount(game_idx, weights=pie_num, minlength=len(games))[game_idx]
+
+    # Games with no possessions / a zero PIE denominator are left out of that average
+    has_usg = t_poss > 0
+    has_pie = t_pie_denom != 0
+    with np.errstate(invalid="ignore", divide="ignore"):
+        usg = np.where(has_usg, p_poss / t_poss * 100, 0.0)
+        pie = np.where(has_pie, pie_num / t_pie_denom * 100, 0.0)
+        usg_pct = _round1(_group_sum(codes, usg, n) / np.bincount(codes, has_usg, n))
+        pie_avg = _round1(_group_sum(codes, pie, n) / np.bincount(codes, has_pie, n))
+
+    df = pd.DataFrame({
+        "name":    np.asarray(names, dtype=object),
+        "pos":     _primary_pos(players, codes, n),
+        "games":   np.bincount(codes, minlength=n),
+        "usg_pct": usg_pct,
+        "pie":     pie_avg,
+    })
     if not df.empty:
         df = df.sort_values("pie", ascending=False, na_position="last").reset_index(drop=True)
     return df
@@ -682,43 +781,26 @@ def get_defensive_impact(games: list) -> pd.DataFrame:
     Def Rating proxy (opp pts when this player plays, avg),
     Foul trouble rate.
     """
-    buckets: dict = {}
-    for game in games:
-        opp_pts  = game["score"]["them"]
-        for p in game["players"]:
-            name = normalize_name(p["name"])
-            pos  = p.get("pos", "").strip()
-            key  = name
-            if key not in buckets:
-                buckets[key] = {"name": name, "pos_list": [],
-                                "games": 0, "stl": 0, "blk": 0,
-                                "fls": 0, "opp_pts_list": []}
-            if pos:
-                buckets[key]["pos_list"].append(pos)
-            d = buckets[key]
-            d["games"]    += 1
-            d["stl"]      += p.get("stl", 0)
-            d["blk"]      += p.get("blk", 0)
-            d["fls"]      += p.get("fls", 0)
-            d["opp_pts_list"].append(opp_pts)
-
-    rows = []
-    for name, d in buckets.items():
-        pl = d["pos_list"]
-        pos = max(set(pl), key=pl.count) if pl else ""
-        n = d["games"]
-        rows.append({
-            "name":           name,
-            "pos":            pos,
-            "games":          n,
-            "stl_pg":         round(d["stl"] / n, 1),
-            "blk_pg":         round(d["blk"] / n, 1),
-            "stocks_pg":      round((d["stl"] + d["blk"]) / n, 1),
-            "fls_pg":         round(d["fls"] / n, 1),
-            "foul_rate":      round(d["fls"] / n / 4 * 100, 1),  # % of max 4 fouls used
-            "avg_opp_pts":    round(sum(d["opp_pts_list"]) / n, 1),
-        })
-    df = pd.DataFrame(rows)
+    players, codes, names, game_idx = _player_groups(games)
+    n = len(names)
+    games_n = np.bincount(codes, minlength=n)
+    stl = _group_sum(codes, players["stl"].to_numpy(dtype=np.float64), n)
+    blk = _group_sum(codes, players["blk"].to_numpy(dtype=np.float64), n)
+    fls = _group_sum(codes, players["fls"].to_numpy(dtype=np.float64), n)
+    opp_pts = np.array([g["score"]["them"] for g in games], dtype=np.float64)
+    opp_sum = _group_sum(codes, opp_pts[game_idx] if len(games) else np.zeros(0), n)
+
+    df = pd.DataFrame({
+        "name":        np.asarray(names, dtype=object),
+        "pos":         _primary_pos(players, codes, n),
+        "games":       games_n,
+        "stl_pg":      _round1(stl / games_n),
+        "blk_pg":      _round1(blk / games_n),
+        "stocks_pg":   _round1((stl + blk) / games_n),
+        "fls_pg":      _round1(fls / games_n),
+        "foul_rate":   _round1(fls / games_n / 4 * 100),  # % of max 4 fouls used
+        "avg_opp_pts": _round1(opp_sum / games_n),
+    })
     if not df.empty:
         df = df.sort_values("stocks_pg", ascending=False).reset_index(drop=True)
     return df
@@ -738,63 +820,56 @@ def _calc_gs(p: dict) -> float:
             + 0.7*reb + 0.3*ast + stl + 0.7*blk - 0.4*fls - to)
 
 
+QUARTERS = ["Q1", "Q2", "Q3", "Q4"]
+
+
+def _quarter_grid(games: list) -> np.ndarray:
+    """(n_games, 2, 4) int array of quarter points: row 0 USA, row 1 opponent; missing quarters are 0."""
+    grid = np.zeros((len(games), 2, 4), dtype=np.int64)
+    for gi, game in enumerate(games):
+        q = game.get("quarters", {})
+        for side, key in enumerate(("us", "them")):
+            pts = q.get(key, [0, 0, 0, 0])[:4]
+            grid[gi, side, :len(pts)] = pts
+    return grid
+
+
 def get_quarter_stats(games: list) -> pd.DataFrame:
     """Per-game quarter breakdown for team scoring momentum."""
-    rows = []
-    for game in games:
-        q    = game.get("quarters", {})
-        us   = q.get("us",   [0, 0, 0, 0])
-        them = q.get("them", [0, 0, 0, 0])
-        # pad to 4 quarters
-        us   = (us   + [0, 0, 0, 0])[:4]
-        them = (them + [0, 0, 0, 0])[:4]
-        margin = game["score"]["us"] - game["score"]["them"]
-        rows.append({
-            "game_id":       game["id"],
-            "date":          game["date"],
-            "opponent":      game["opponent"],
-            "result":        game.get("result", "W"),
-            "q1_us":         us[0], "q2_us": us[1], "q3_us": us[2], "q4_us": us[3],
-            "q1_them":       them[0], "q2_them": them[1], "q3_them": them[2], "q4_them": them[3],
-            "final_margin":  margin,
-            "best_quarter":  ["Q1", "Q2", "Q3", "Q4"][us.index(max(us))],
-            "worst_quarter": ["Q1", "Q2", "Q3", "Q4"][us.index(min(us))],
-        })
-    return pd.DataFrame(rows)
+    grid = _quarter_grid(games)
+    us, them = grid[:, 0], grid[:, 1]
+    labels = np.array(QUARTERS)
+    out = {
+        "game_id":  [g["id"] for g in games],
+        "date":     [g["date"] for g in games],
+        "opponent": [g["opponent"] for g in games],
+        "result":   [g.get("result", "W") for g in games],
+    }
+    out.update({f"q{i + 1}_us": us[:, i] for i in range(4)})
+    out.update({f"q{i + 1}_them": them[:, i] for i in range(4)})
+    out["final_margin"] = [g["score"]["us"] - g["score"]["them"] for g in games]
+    # argmax/argmin return the first quarter on ties, like list.index(max(...))
+    out["best_quarter"] = labels[us.argmax(axis=1)] if len(games) else []
+    out["worst_quarter"] = labels[us.argmin(axis=1)] if len(games) else []
+    return pd.DataFrame(out)
 
 
 def get_momentum_analysis(games: list) -> dict:
     """Quarter-by-quarter team momentum: avg pts scored/allowed per quarter."""
-    q_us   = [[], [], [], []]
-    q_them = [[], [], [], []]
-    for game in games:
-        q    = game.get("quarters", {})
-        us   = (q.get("us",   [0, 0, 0, 0]) + [0, 0, 0, 0])[:4]
-        them = (q.get("them", [0, 0, 0, 0]) + [0, 0, 0, 0])[:4]
-        for i in range(4):
-            q_us[i].append(us[i])
-            q_them[i].append(them[i])
-
-    def _avg(lst):
-        return round(sum(lst) / len(lst), 1) if lst else 0
-
-    us_avgs   = [_avg(q_us[i])   for i in range(4)]
-    them_avgs = [_avg(q_them[i]) for i in range(4)]
-    labels    = ["Q1", "Q2", "Q3", "Q4"]
-
-    comeback_wins = sum(
-        1 for g in games
-        if g.get("result", "") == "W"
-        and (g.get("quarters", {}).get("us",   [0]*4) + [0]*4)[:4][2]
-          < (g.get("quarters", {}).get("them", [0]*4) + [0]*4)[:4][2]
-    )
+    grid = _quarter_grid(games)
+    if len(games):
+        us_avgs, them_avgs = (_round1(avgs).tolist() for avgs in grid.mean(axis=0))
+    else:
+        us_avgs, them_avgs = [0] * 4, [0] * 4
+    won = np.array([g.get("result", "") == "W" for g in games], dtype=bool)
+    comeback_wins = int(np.count_nonzero(won & (grid[:, 0, 2] < grid[:, 1, 2])))
 
     return {
-        "quarters":         labels,
+        "quarters":         list(QUARTERS),
         "us_avg":           us_avgs,
         "them_avg":         them_avgs,
-        "us_best_quarter":  labels[us_avgs.index(max(us_avgs))]  if us_avgs else "N/A",
-        "us_worst_quarter": labels[us_avgs.index(min(us_avgs))]  if us_avgs else "N/A",
+        "us_best_quarter":  QUARTERS[us_avgs.index(max(us_avgs))],
+        "us_worst_quarter": QUARTERS[us_avgs.index(min(us_avgs))],
         "comeback_wins":    comeback_wins,
         "q_diff":           [round(us_avgs[i] - them_avgs[i], 1) for i in range(4)],
     }
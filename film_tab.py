@@ -15,6 +15,11 @@ from pathlib import Path
 
 import streamlit as st
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # ── Paths ─────────────────────────────────────────────────────────────────────
 _HERE    = Path(__file__).parent
 _LIB_DIR = _HERE / "film_library"
@@ -25,6 +30,8 @@ _LIB_JSON = _LIB_DIR / "film_library.json"
 
 def _load_library() -> dict:
     if _LIB_JSON.exists():
+        if orjson is not None:
+            return orjson.loads(_LIB_JSON.read_bytes())
         with open(_LIB_JSON, "r", encoding="utf-8") as f:
             return json.load(f)
     return {"sessions": []}
@@ -43,7 +50,9 @@ def _session_id(date_str: str, opponent: str) -> str:
 
 # ── game_tracker loader (lazy, avoids top-level EasyOCR import) ───────────────
 
+@st.cache_resource(show_spinner=False)
 def _load_tracker_mod():
+    # Executed once per server process — not re-imported on every rerun
     spec = importlib.util.spec_from_file_location(
         "game_tracker", str(_HERE / "game_tracker.py")
     )
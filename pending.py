@@ -1,28 +1,34 @@
 # pending.py
 import json
 from pathlib import Path
-from data import load_games, save_games
+from data import WRITE_BUFFER, load_games, save_games, load_screenshot_index
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 PENDING_FILE = Path(__file__).parent / "pending_games.json"
 
 def load_pending() -> dict:
     if not PENDING_FILE.exists():
         return {"pending": []}
+    if orjson is not None:
+        return orjson.loads(PENDING_FILE.read_bytes())
     with open(PENDING_FILE, "r", encoding="utf-8") as f:
         return json.load(f)
 
 def save_pending(data: dict) -> None:
-    with open(PENDING_FILE, "w", encoding="utf-8") as f:
+    with open(PENDING_FILE, "w", encoding="utf-8", buffering=WRITE_BUFFER) as f:
         json.dump(data, f, indent=2)
 
 def add_to_pending(record: dict) -> None:
     data = load_pending()
-    existing = [g["screenshot"] for g in data["pending"]]
+    existing = {g["screenshot"] for g in data["pending"]}
     if record["screenshot"] in existing:
         print(f"[SKIP] Already pending: {record['screenshot']}")
         return
-    approved = load_games()
-    if record["screenshot"] in [g["screenshot"] for g in approved["games"]]:
+    if record["screenshot"] in load_screenshot_index():
         print(f"[SKIP] Already approved: {record['screenshot']}")
         return
     data["pending"].append(record)
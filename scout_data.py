@@ -4,12 +4,19 @@ import json
 import pandas as pd
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 SCOUT_FILE = Path(__file__).parent / "scouting.json"
 
 
 def load_scouting() -> dict:
     if not SCOUT_FILE.exists():
         return {"scout_team": "Puerto Rico", "games": [], "pending": []}
+    if orjson is not None:
+        return orjson.loads(SCOUT_FILE.read_bytes())
     with open(SCOUT_FILE, "r", encoding="utf-8") as f:
         return json.load(f)
 
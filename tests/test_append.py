@@ -1,7 +1,7 @@
 # tests/test_append.py
-import json, pytest
+import json, msgspec, pytest
 from pathlib import Path
-from append_game import validate_game, build_game_record
+from append_game import validate_game, build_game_record, append_game, decode_game
 
 def test_validate_game_passes_valid():
     game = {
@@ -25,3 +25,56 @@ def test_build_game_record_sets_id():
     assert record["opponent"] == "Brazil"
     assert record["score"]["us"] == 81
     assert len(record["id"]) > 0
+
+def test_append_game_writes_sidecar_and_compacts(tmp_path, monkeypatch):
+    import data
+    monkeypatch.setattr(data, "GAMES_FILE", tmp_path / "games.json")
+    monkeypatch.setattr(data, "GAMES_LOG", tmp_path / "games.jsonl")
+    monkeypatch.setattr(data, "SCREENSHOT_INDEX", tmp_path / "screenshots.idx")
+    data.save_games({"games": []})
+    record = build_game_record("Brazil", 81, 62, [15,20,26,20], [16,14,20,12], [], "test.png", "2026-02-21")
+    data.append_game_record(record)
+    assert data.load_games()["games"] == [record]
+    assert data.compact_games() == 1
+    assert not (tmp_path / "games.jsonl").exists()
+    assert data.load_games()["games"] == [record]
+
+def test_append_game_skips_known_screenshot(tmp_path, monkeypatch, capsys):
+    import data
+    monkeypatch.setattr(data, "GAMES_FILE", tmp_path / "games.json")
+    monkeypatch.setattr(data, "GAMES_LOG", tmp_path / "games.jsonl")
+    monkeypatch.setattr(data, "SCREENSHOT_INDEX", tmp_path / "screenshots.idx")
+    record = build_game_record("Brazil", 81, 62, [15,20,26,20], [16,14,20,12], [], "test.png", "2026-02-21")
+    append_game(record)
+    append_game(dict(record, id="game_dupe"))
+    assert "[SKIP]" in capsys.readouterr().out
+    assert len(data.load_games()["games"]) == 1
+    assert data.load_screenshot_index() == {"test.png"}
+
+def test_append_game_skips_screenshot_added_behind_index(tmp_path, monkeypatch, capsys):
+    import data
+    monkeypatch.setattr(data, "GAMES_FILE", tmp_path / "games.json")
+    monkeypatch.setattr(data, "GAMES_LOG", tmp_path / "games.jsonl")
+    monkeypatch.setattr(data, "SCREENSHOT_INDEX", tmp_path / "screenshots.idx")
+    data.save_games({"games": []})
+    assert data.load_screenshot_index() == set()
+    # games.json changes without going through save_games (git pull, hand edit)
+    pulled = build_game_record("Brazil", 81, 62, [15,20,26,20], [16,14,20,12], [], "pulled.png", "2026-02-21")
+    (tmp_path / "games.json").write_text(json.dumps({"games": [pulled]}))
+    append_game(dict(pulled, id="game_dupe"))
+    assert "[SKIP]" in capsys.readouterr().out
+    assert len(data.load_games()["games"]) == 1
+
+def test_decode_game_accepts_float_scores_and_keeps_extra_keys():
+    record = dict(build_game_record("Brazil", 81.0, 62, [15,20,26,20.0], [16,14,20,12], [], "test.png", "2026-02-21"),
+                  opponent_players=[], _ocr_meta={"claude_verified": True})
+    game = decode_game(json.dumps(record).encode())
+    assert game.score.us == 81.0 and game.quarters.us[-1] == 20.0
+    assert msgspec.to_builtins(game) == record
+
+def test_decode_game_rejects_missing_and_unknown_fields():
+    with pytest.raises(ValueError):
+        decode_game(b'{"id": "game_001", "opponent": "Brazil"}')
+    record = build_game_record("Brazil", 81, 62, [15,20,26,20], [16,14,20,12], [], "test.png", "2026-02-21")
+    with pytest.raises(ValueError):
+        decode_game(json.dumps(dict(record, surprise=1)).encode())
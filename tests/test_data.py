@@ -1,6 +1,7 @@
 # tests/test_data.py
 import pytest
-from data import load_games, get_player_totals, get_player_averages, get_derived_stats
+from data import (load_games, get_player_totals, get_player_averages, get_derived_stats,
+                  games_to_players_table, get_defensive_impact, lttb_indices)
 
 SAMPLE_GAMES = {
   "games": [
@@ -64,3 +65,42 @@ def test_get_derived_stats():
     obj = derived[derived["name"] == "OBJ3onTwitch"].iloc[0]
     assert round(obj["fg_pct"], 3) == round(12/22, 3)
     assert round(obj["tp_pct"], 3) == round(5/14, 3)
+
+def test_games_to_players_table():
+    table = games_to_players_table(SAMPLE_GAMES["games"])
+    assert len(table) == 2
+    assert list(table["game_id"]) == ["game_001", "game_002"]
+    assert list(table["us_pts"]) == [81, 71]
+    assert table["pos"].tolist() == ["", ""]
+
+def test_games_without_players():
+    games = [dict(g, players=[]) for g in SAMPLE_GAMES["games"]]
+    table = games_to_players_table(games)
+    assert table.empty and "name" in table.columns
+    assert get_player_totals(games).empty
+    assert get_player_averages(games).empty
+
+def test_get_defensive_impact():
+    df = get_defensive_impact(SAMPLE_GAMES["games"])
+    obj = df[df["name"] == "OBJ3onTwitch"].iloc[0]
+    assert obj["games"] == 2
+    assert obj["stocks_pg"] == 1.0
+    assert obj["avg_opp_pts"] == 56.5
+    assert obj["pos"] == ""
+
+def test_lttb_indices():
+    y = [0, 1, 0, 5, 0, 1, 0, 1, 0, 1]
+    keep = lttb_indices(y, 4)
+    assert len(keep) == 4
+    assert keep[0] == 0 and keep[-1] == len(y) - 1
+    assert 3 in keep  # the spike survives downsampling
+    assert list(lttb_indices(y, 20)) == list(range(len(y)))
+
+def test_games_file_keeps_top_level_keys(tmp_path, monkeypatch):
+    import data
+    monkeypatch.setattr(data, "GAMES_FILE", tmp_path / "games.json")
+    monkeypatch.setattr(data, "GAMES_LOG", tmp_path / "games.jsonl")
+    monkeypatch.setattr(data, "SCREENSHOT_INDEX", tmp_path / "screenshots.idx")
+    payload = {**SAMPLE_GAMES, "season": "2026 Spring"}
+    data.save_games(payload)
+    assert data.load_games() == payload